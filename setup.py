@@ -0,0 +1,21 @@
+# Optional Cython build for the simulation hot loops (Customer.start and
+# Restaurant.generate_customers are invoked thousands of times per run, and
+# compiling the module cuts bytecode dispatch overhead).
+#
+# Build with:
+#     python setup.py build_ext --inplace
+#
+# then `import simulation` picks up the compiled extension. Running
+# `python simulation.py` directly still uses the pure-Python module, which
+# stays the fallback for interpreters where Cython is unavailable (e.g. PyPy).
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Cython is required for the compiled build: pip install cython")
+
+setup(
+    name="restaurant-simulation",
+    ext_modules=cythonize("simulation.py", language_level=3),
+)
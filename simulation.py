@@ -1,8 +1,90 @@
+import multiprocessing
+import sys
+import types
+
 import simpy
-import simpy.events
-import matplotlib.pyplot as plt
 import numpy as np
-import random
+
+# SimPy's scheduler is pure Python (heapq + generator.send), so the event loop
+# runs much faster under PyPy's JIT: `pypy3 simulation.py` is the fast path
+# (see pypy_requirements.txt). Skip CPython-oriented imports there.
+if '__pypy__' not in sys.builtin_module_names:
+    import matplotlib.pyplot as plt
+
+# Numba is optional: when present, the Lindley departure recurrence in the
+# analytical engine runs as machine code instead of an interpreted loop.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Departure times for one single-server FCFS station via the Lindley recurrence
+#     d[i] = max(d[i-1], a[i]) + s[i]
+# Each customer is coupled to the previous one, so this cannot be expressed as a
+# pure array operation; the JIT makes the loop cheap anyway.
+def lindleyDepartures(arrivals, serviceTimes):
+    departures = np.empty(len(arrivals))
+    lastDeparture = 0.0
+    for i in range(len(arrivals)):
+        start = lastDeparture if lastDeparture > arrivals[i] else arrivals[i]
+        lastDeparture = start + serviceTimes[i]
+        departures[i] = lastDeparture
+    return departures
+
+# Exit times for the stayers through all three stations in a single pass. Order,
+# pay and pickup departures each follow the Lindley recurrence with the previous
+# station's departures as arrivals, and food prep runs in parallel from the end
+# of ordering; fusing the stages means one loop and no intermediate arrays.
+def tandemExitTimes(arrivals, orderTimes, prepTimes, payTimes, pickupTimes):
+    exitTimes = np.empty(len(arrivals))
+    lastOrder = 0.0
+    lastPay = 0.0
+    lastPickup = 0.0
+    for i in range(len(arrivals)):
+        lastOrder = (lastOrder if lastOrder > arrivals[i] else arrivals[i]) + orderTimes[i]
+        lastPay = (lastPay if lastPay > lastOrder else lastOrder) + payTimes[i]
+        lastPickup = (lastPickup if lastPickup > lastPay else lastPay) + pickupTimes[i]
+        prepDone = lastOrder + prepTimes[i]
+        exitTimes[i] = lastPickup if lastPickup > prepDone else prepDone
+    return exitTimes
+
+# Stay/balk decision for every arrival at the order station. A customer balks
+# when more than maxInLine earlier stayers have not yet left the station; the
+# decision must be made customer-by-customer, because whether i balks changes
+# the line length seen by every later arrival.
+def balkingDecisions(arrivals, orderTimes, maxInLine):
+    n = len(arrivals)
+    stayed = np.zeros(n, dtype=np.bool_)
+    departures = np.empty(n)
+    numStayed = 0
+    lastDeparture = 0.0
+    for i in range(n):
+        queueLength = numStayed - np.searchsorted(departures[:numStayed], arrivals[i])
+        if queueLength <= maxInLine:
+            start = lastDeparture if lastDeparture > arrivals[i] else arrivals[i]
+            lastDeparture = start + orderTimes[i]
+            departures[numStayed] = lastDeparture
+            stayed[i] = True
+            numStayed += 1
+    return stayed
+
+# numba can only wrap plain Python functions; under the optional Cython build
+# (setup.py) these are already compiled methods, which numba rejects at import,
+# so leave the Cython versions as they are.
+if njit is not None and isinstance(lindleyDepartures, types.FunctionType):
+    lindleyDepartures = njit(cache=True)(lindleyDepartures)
+    tandemExitTimes = njit(cache=True)(tandemExitTimes)
+    balkingDecisions = njit(cache=True)(balkingDecisions)
+
+
+# Set to an int for reproducible runs; None seeds from OS entropy.
+RANDOM_SEED = None
+
+# One shared Generator for every draw in the process. Unlike the random module's
+# global state there is no lock around it, and all sampling goes through its
+# vectorized methods.
+rng = np.random.default_rng(RANDOM_SEED)
 
 
 # Restaurant class represents a Restaurant's drive thru process.
@@ -31,11 +113,25 @@ class Restaurant:
         self.env = env
         Restaurant.restaurantNumber += 1
         self.restaurantNumber = Restaurant.restaurantNumber
-        self.customerList = []
         self.totalCustomers = 0
         self.numCustomersLeft = 0
         self.numCustomersStayed = 0
 
+        # Per-customer timing columns, indexed by customer id. Kept as parallel
+        # NumPy arrays (rather than per-customer attributes) so the stats can
+        # be computed with array operations instead of Python loops.
+        # Note: If the customer leaves because the line is too long, these values will remain -1.0
+        self.enterTime = np.empty(0)
+        self.exitTime = np.empty(0)
+        self.orderDuration = np.empty(0)
+        self.prepDuration = np.empty(0)
+        self.payDuration = np.empty(0)
+        self.pickupDuration = np.empty(0)
+
+        # Memoized calculateMean* results; each restaurant runs one simulation,
+        # so a computed mean never goes stale.
+        self.meanCache = {}
+
         # Stations.
         self.orderStation = orderStation
         self.payStation = payStation
@@ -43,136 +139,102 @@ class Restaurant:
 
     # Generate new customers and send them through the drive thru line.
     def generate_customers(self, numOfCustomers):
-        for c in range(numOfCustomers):
-            # Generate customer.
-            newCustomer = Customer(self.env, self)
-
-            self.customerList.append(newCustomer)
+        # Preallocate the timing columns for every potential customer.
+        self.enterTime = np.full(numOfCustomers, -1.0)
+        self.exitTime = np.full(numOfCustomers, -1.0)
+        self.orderDuration = np.full(numOfCustomers, -1.0)
+        self.prepDuration = np.full(numOfCustomers, -1.0)
+        self.payDuration = np.full(numOfCustomers, -1.0)
+        self.pickupDuration = np.full(numOfCustomers, -1.0)
+
+        # Pre-sample every random variate in one vectorized draw per distribution
+        # instead of calling random.weibullvariate/expovariate per event. Customers
+        # pick up their draws by idx; numpy's weibull is scaled by the mean time to
+        # match random.weibullvariate(mean, shape).
+        self.arrivalGaps = rng.exponential(1.0 / Restaurant.CUSTOMER_ARRIVAL_RATE, numOfCustomers)
+        self.orderDraws = rng.weibull(1.5, numOfCustomers) * Restaurant.meanOrderTime
+        self.prepDraws = rng.weibull(2.0, numOfCustomers) * Restaurant.meanFoodPrepTime
+        self.payDraws = rng.weibull(1.5, numOfCustomers) * Restaurant.meanPayTime
+        self.pickupDraws = rng.weibull(1.5, numOfCustomers) * Restaurant.meanPickupTime
 
+        for c in range(numOfCustomers):
+            # Launch the customer's process; no per-customer object is built.
             self.totalCustomers += 1
-            env.process(newCustomer.start())
+            env.process(customerProcess(env, self, c))
 
             # Customer arrives every x minutes
-            t = random.expovariate(Restaurant.CUSTOMER_ARRIVAL_RATE)
-            yield env.timeout(t)
+            yield env.timeout(self.arrivalGaps[c])
     
     # Mean time a customer waited in the drive thru. Returns time in minutes.
     # NOTE: Value may not be accurate unless the simulation has already been ran.
     def calculateMeanDriveThruTime(self):
-        meanTime = 0.0
-
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.enterTime != -1.0 and person.exitTime != -1.0:
-                timeSpent = person.exitTime - person.enterTime
-                meanTime += timeSpent
-        
-        meanTime = float(meanTime / self.numCustomersStayed)
-        return meanTime
-    
+        if 'driveThru' not in self.meanCache:
+            # The columns cover ALL potential customers; entries stay -1.0 for those who left early..
+            mask = (self.enterTime >= 0) & (self.exitTime >= 0)
+            self.meanCache['driveThru'] = float((self.exitTime[mask] - self.enterTime[mask]).sum() / self.numCustomersStayed)
+        return self.meanCache['driveThru']
+
     # Mean time a customer took to order. Returns time in minutes.
     # NOTE: Value may not be accurate unless the simulation has already been ran.
     def calculateMeanOrderTime(self):
-        meanTime = 0.0
-
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.orderDuration != -1:
-                meanTime += person.orderDuration
-        
-        meanTime = float(meanTime / self.numCustomersStayed)
-        return meanTime
+        if 'order' not in self.meanCache:
+            self.meanCache['order'] = float(self.orderDuration[self.orderDuration >= 0].sum() / self.numCustomersStayed)
+        return self.meanCache['order']
 
     # Mean time it took for food to be prepared. Returns time in minutes.
     # NOTE: Value may not be accurate unless the simulation has already been ran.
     def calculateMeanPrepTime(self):
-        meanTime = 0.0
-
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.prepDuration != -1:
-                meanTime += person.prepDuration
-        
-        meanTime = float(meanTime / self.numCustomersStayed)
-        return meanTime
+        if 'prep' not in self.meanCache:
+            self.meanCache['prep'] = float(self.prepDuration[self.prepDuration >= 0].sum() / self.numCustomersStayed)
+        return self.meanCache['prep']
 
     # Mean time a customer took to pay. Returns time in minutes.
     # NOTE: Value may not be accurate unless the simulation has already been ran.
     def calculateMeanPayTime(self):
-        meanTime = 0.0
-
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.payDuration != -1:
-                meanTime += person.payDuration
-        
-        meanTime = float(meanTime / self.numCustomersStayed)
-        return meanTime
-    
+        if 'pay' not in self.meanCache:
+            self.meanCache['pay'] = float(self.payDuration[self.payDuration >= 0].sum() / self.numCustomersStayed)
+        return self.meanCache['pay']
+
     # Mean time a customer took to pickup. Returns time in minutes.
     # NOTE: Value may not be accurate unless the simulation has already been ran.
     def calculateMeanPickupTime(self):
-        meanTime = 0.0
-
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.pickupDuration != -1:
-                meanTime += person.pickupDuration
-        
-        meanTime = float(meanTime / self.numCustomersStayed)
-        return meanTime
+        if 'pickup' not in self.meanCache:
+            self.meanCache['pickup'] = float(self.pickupDuration[self.pickupDuration >= 0].sum() / self.numCustomersStayed)
+        return self.meanCache['pickup']
 
     def getOrderTimes(self):
-        times = []
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.orderDuration != -1:
-                times.append(person.orderDuration)
-        return times
-    
+        return self.orderDuration[self.orderDuration >= 0]
+
     def getPayTimes(self):
-        times = []
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.payDuration != -1:
-                times.append(person.payDuration)
-        return times
+        return self.payDuration[self.payDuration >= 0]
 
     def getPickupTimes(self):
-        times = []
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.pickupDuration != -1:
-                times.append(person.pickupDuration)
-        return times
+        return self.pickupDuration[self.pickupDuration >= 0]
 
     def getPrepTimes(self):
-        times = []
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.prepDuration != -1:
-                times.append(person.prepDuration)
-        return times
+        return self.prepDuration[self.prepDuration >= 0]
 
+    # Ids (idx values) of the customers who entered the line and made it through.
     def getCustomersThatStayed(self):
-        customers = []
-        # customerList contains ALL potential customers, including those who entered the line AND those who left early..
-        for person in self.customerList:
-            if person.enterTime != -1 and person.exitTime != -1:
-                customers.append(person)
-        return customers
+        mask = (self.enterTime >= 0) & (self.exitTime >= 0)
+        return np.nonzero(mask)[0]
+
+    def formatStats(self):
+        return "\n".join([
+            f"--------------------------------------- Restaurant {self.restaurantNumber} Stats ---------------------------------------",
+            f"{self.totalCustomers} potential customers..",
+            f"{self.numCustomersLeft} customers left..",
+            f"{self.numCustomersStayed} customers entered the line..\n",
+            f"Average time spent in drive thru: {self.calculateMeanDriveThruTime()} minutes..",
+            f"Average time spent ordering: {self.calculateMeanOrderTime()} minutes..",
+            f"Average time spent preparing food: {self.calculateMeanPrepTime()} minutes..",
+            f"Average time spent paying: {self.calculateMeanPayTime()} minutes..",
+            f"Average time spent picking up food: {self.calculateMeanPickupTime()} minutes..",
+            "------------------------------------------------------------------------------------------------",
+        ])
 
     def printStats(self):
-        print(f"--------------------------------------- Restaurant {self.restaurantNumber} Stats ---------------------------------------")
-        print(f"{self.totalCustomers} potential customers..")
-        print(f"{self.numCustomersLeft} customers left..")
-        print(f"{self.numCustomersStayed} customers entered the line..\n")
-        print(f"Average time spent in drive thru: {self.calculateMeanDriveThruTime()} minutes..")
-        print(f"Average time spent ordering: {self.calculateMeanOrderTime()} minutes..")
-        print(f"Average time spent preparing food: {self.calculateMeanPrepTime()} minutes..")
-        print(f"Average time spent paying: {self.calculateMeanPayTime()} minutes..")
-        print(f"Average time spent picking up food: {self.calculateMeanPickupTime()} minutes..")
-        print("------------------------------------------------------------------------------------------------")
+        print(self.formatStats())
 
 
 
@@ -183,111 +245,230 @@ class Restaurant:
 
 
 
-# Customer class represents one customer waiting in the queue.
-#            env: simpy simulation environment.
-#     restaurant: object of Restaurant class.
-class Customer:
-    
-    # If true, print customer events to the console. Use for debugging.
-    isEventStampingOn = True
-    customerNumber = 0
+# AnalyticalRestaurant computes the same drive thru statistics without running an
+# event-by-event simulation. Arrival gaps and service times are drawn up front as
+# NumPy arrays, and each station's departure times come from the Lindley recurrence
+#     d[i] = max(d[i-1], a[i]) + s[i]
+# with stage k's departures feeding stage k+1 as arrivals. Customers balk at entry
+# when the order line is over capacity, matching the SimPy model's entry check.
+# Downstream buffer blocking is not modeled, so results are an approximation of the
+# SimPy engine, but the per-customer event-loop overhead is gone entirely.
+class AnalyticalRestaurant:
 
-    def __init__(self, env, restaurant):
-        self.env = env
-        self.restaurant = restaurant
+    restaurantNumber = 0
 
-        Customer.customerNumber += 1
-        self.number = Customer.customerNumber
+    def __init__(self):
+        AnalyticalRestaurant.restaurantNumber += 1
+        self.restaurantNumber = AnalyticalRestaurant.restaurantNumber
+        self.totalCustomers = 0
+        self.numCustomersLeft = 0
+        self.numCustomersStayed = 0
 
-        # Track enter/exit in simulation time. 
-        # Note: If the customer leaves because the line is too long, these values will remain -1.0
-        self.enterTime = -1.0
-        self.exitTime = -1.0
-        self.orderDuration = -1.0
-        self.prepDuration = -1.0
-        self.payDuration = -1.0
-        self.pickupDuration = -1.0
-
-    # Start the simulation of customer going through drive thru line.
-    def start(self):
-        # Enter the drive thru if there is enough space. Max of 7 customers in line plus the 1 at each order station.
-        if (len(self.restaurant.orderStation.queue) <= (7 + self.restaurant.orderStation.capacity)):
-
-            self.event_stamp(f"Customer {self.number} enters the line. {len(self.restaurant.orderStation.queue)} customers in order line.")
-            self.enterTime = env.now
-            self.restaurant.numCustomersStayed += 1
-
-            # Wait for an open order station.
-            order = self.restaurant.orderStation.request()
-            yield order
-
-            # Enter the order station.
-            self.event_stamp(f"Customer {self.number} is ordering.")
-            delay = random.weibullvariate(Restaurant.meanOrderTime, 1.5)
-            orderDelay = simpy.events.Timeout(env, delay)
-            self.orderDuration = delay
-            yield orderDelay
-
-            # Start food prep.
-            prepTimeDelay = random.weibullvariate(Restaurant.meanFoodPrepTime, 2.0)
-            prepDelay = simpy.events.Timeout(env, prepTimeDelay)
-            self.prepDuration = prepTimeDelay
-
-            # Wait until there is enough space to move forward. Max 4 between order and pay station, plus 1 in the pay station.
-            if (len(self.restaurant.payStation.queue) >= 5):
-                self.event_stamp("pay station full... waiting...")
-                yield self.restaurant.payStation.queue[0]
-
-            # Finished ordering, leave the order station.
-            self.restaurant.orderStation.release(order)
-
-
-            # Wait for an open pay station.
-            pay = self.restaurant.payStation.request()
-            yield pay
-            
-            # Enter the pay station.
-            self.event_stamp(f"Customer {self.number} is paying. {len(self.restaurant.payStation.queue)} customers in pay line.")
-            delay = random.weibullvariate(Restaurant.meanPayTime, 1.5)
-            payDelay = simpy.events.Timeout(env, delay)
-            self.payDuration = delay
-            yield payDelay
-
-            # Wait until there is enough space to move forward. Max 1 between pay and pickup station, plus 1 in the pickup station.
-            if (len(self.restaurant.pickupStation.queue) >= 2):
-                self.event_stamp("pickup station full... waiting...")
-                yield self.restaurant.pickupStation.queue[0]
-
-            # Finished paying, leave the pay station.
-            self.restaurant.payStation.release(pay)
-
-
-            # Wait for an open pickup station.
-            pickup = self.restaurant.pickupStation.request()
-            yield pickup
-
-            # Enter the pickup station.
-            self.event_stamp(f"Customer {self.number} is picking up. {len(self.restaurant.pickupStation.queue)} customers in pickup line.")
-            delay = random.weibullvariate(Restaurant.meanPickupTime, 1.5)
-            pickupDelay = simpy.events.Timeout(env, delay)
-            self.pickupDuration = delay
+        # Memoized calculateMean* results (see Restaurant.meanCache).
+        self.meanCache = {}
+
+        # Per-customer result columns, filled in by simulate().
+        self.enterTime = np.empty(0)
+        self.exitTime = np.empty(0)
+        self.orderDuration = np.empty(0)
+        self.prepDuration = np.empty(0)
+        self.payDuration = np.empty(0)
+        self.pickupDuration = np.empty(0)
+
+    # Run the analytical computation for numOfCustomers arrivals, truncated at
+    # untilTime minutes of simulated time (same cutoff as env.run(untilTime)).
+    def simulate(self, numOfCustomers, untilTime):
+        arrivals = rng.exponential(1.0 / Restaurant.CUSTOMER_ARRIVAL_RATE, numOfCustomers).cumsum()
+        arrivals = arrivals[arrivals < untilTime]
+        n = len(arrivals)
+        self.totalCustomers = n
+
+        orderTimes = rng.weibull(1.5, n) * Restaurant.meanOrderTime
+        prepTimes = rng.weibull(2.0, n) * Restaurant.meanFoodPrepTime
+        payTimes = rng.weibull(1.5, n) * Restaurant.meanPayTime
+        pickupTimes = rng.weibull(1.5, n) * Restaurant.meanPickupTime
+
+        # Entry balking: a customer leaves when the order line already holds more
+        # than 7 waiting cars plus the one at the station. The decision loop is
+        # exact (balkers never count toward later line lengths) and JIT-compiled
+        # like the other kernels.
+        stayed = balkingDecisions(arrivals, orderTimes, 7 + Restaurant.NUM_OF_ORDER_STATIONS)
+        numStayed = int(stayed.sum())
+
+        self.numCustomersStayed = numStayed
+        self.numCustomersLeft = n - numStayed
+
+        # Push the stayers through all three stations in one fused pass.
+        self.enterTime = arrivals[stayed]
+        self.exitTime = tandemExitTimes(arrivals[stayed], orderTimes[stayed],
+                                        prepTimes[stayed], payTimes[stayed],
+                                        pickupTimes[stayed])
+        self.orderDuration = orderTimes[stayed]
+        self.prepDuration = prepTimes[stayed]
+        self.payDuration = payTimes[stayed]
+        self.pickupDuration = pickupTimes[stayed]
+
+    # Mean time a customer waited in the drive thru. Returns time in minutes.
+    def calculateMeanDriveThruTime(self):
+        if 'driveThru' not in self.meanCache:
+            self.meanCache['driveThru'] = float((self.exitTime - self.enterTime).sum() / self.numCustomersStayed)
+        return self.meanCache['driveThru']
+
+    # Mean time a customer took to order. Returns time in minutes.
+    def calculateMeanOrderTime(self):
+        if 'order' not in self.meanCache:
+            self.meanCache['order'] = float(self.orderDuration.sum() / self.numCustomersStayed)
+        return self.meanCache['order']
+
+    # Mean time it took for food to be prepared. Returns time in minutes.
+    def calculateMeanPrepTime(self):
+        if 'prep' not in self.meanCache:
+            self.meanCache['prep'] = float(self.prepDuration.sum() / self.numCustomersStayed)
+        return self.meanCache['prep']
+
+    # Mean time a customer took to pay. Returns time in minutes.
+    def calculateMeanPayTime(self):
+        if 'pay' not in self.meanCache:
+            self.meanCache['pay'] = float(self.payDuration.sum() / self.numCustomersStayed)
+        return self.meanCache['pay']
+
+    # Mean time a customer took to pickup. Returns time in minutes.
+    def calculateMeanPickupTime(self):
+        if 'pickup' not in self.meanCache:
+            self.meanCache['pickup'] = float(self.pickupDuration.sum() / self.numCustomersStayed)
+        return self.meanCache['pickup']
+
+    def formatStats(self):
+        return "\n".join([
+            f"--------------------------------------- Restaurant {self.restaurantNumber} Stats ---------------------------------------",
+            f"{self.totalCustomers} potential customers..",
+            f"{self.numCustomersLeft} customers left..",
+            f"{self.numCustomersStayed} customers entered the line..\n",
+            f"Average time spent in drive thru: {self.calculateMeanDriveThruTime()} minutes..",
+            f"Average time spent ordering: {self.calculateMeanOrderTime()} minutes..",
+            f"Average time spent preparing food: {self.calculateMeanPrepTime()} minutes..",
+            f"Average time spent paying: {self.calculateMeanPayTime()} minutes..",
+            f"Average time spent picking up food: {self.calculateMeanPickupTime()} minutes..",
+            "------------------------------------------------------------------------------------------------",
+        ])
+
+    def printStats(self):
+        print(self.formatStats())
+
+
+
+
+# If true, print customer events to the console. Use for debugging.
+isEventStampingOn = True
+
+
+# Generator simulating one customer going through the drive thru line. No
+# customer object is allocated: each process is just this generator closed over
+# env, the restaurant, and the customer's idx into the timing columns.
+#            env: simpy simulation environment.
+#     restaurant: object of Restaurant class.
+#            idx: integer id of the customer in the restaurant's columns.
+def customerProcess(env, restaurant, idx):
+    # Bind the hot lookups to locals once; this runs for every customer and each
+    # chained attribute access costs interpreter dispatch.
+    orderStation = restaurant.orderStation
+    payStation = restaurant.payStation
+    pickupStation = restaurant.pickupStation
+    stamping = isEventStampingOn
+    number = idx + 1
+
+    # Enter the drive thru if there is enough space. Max of 7 customers in line plus the 1 at each order station.
+    if (len(orderStation.queue) <= (7 + orderStation.capacity)):
+
+        if stamping:
+            eventStamp(env, "Customer %d enters the line. %d customers in order line.", number, len(orderStation.queue))
+        restaurant.enterTime[idx] = env.now
+        restaurant.numCustomersStayed += 1
+
+        # Wait for an open order station.
+        order = orderStation.request()
+        yield order
+
+        # Enter the order station.
+        if stamping:
+            eventStamp(env, "Customer %d is ordering.", number)
+        delay = restaurant.orderDraws[idx]
+        restaurant.orderDuration[idx] = delay
+        yield env.timeout(delay)
+
+        # Start food prep.
+        prepTimeDelay = restaurant.prepDraws[idx]
+        prepDelay = env.timeout(prepTimeDelay)
+        restaurant.prepDuration[idx] = prepTimeDelay
+
+        # Wait until there is enough space to move forward. Max 4 between order and pay station, plus 1 in the pay station.
+        if (len(payStation.queue) >= 5):
+            if stamping:
+                eventStamp(env, "pay station full... waiting...")
+            yield payStation.queue[0]
+
+        # Finished ordering, leave the order station.
+        orderStation.release(order)
+
+
+        # Wait for an open pay station.
+        pay = payStation.request()
+        yield pay
+
+        # Enter the pay station.
+        if stamping:
+            eventStamp(env, "Customer %d is paying. %d customers in pay line.", number, len(payStation.queue))
+        delay = restaurant.payDraws[idx]
+        restaurant.payDuration[idx] = delay
+        yield env.timeout(delay)
+
+        # Wait until there is enough space to move forward. Max 1 between pay and pickup station, plus 1 in the pickup station.
+        if (len(pickupStation.queue) >= 2):
+            if stamping:
+                eventStamp(env, "pickup station full... waiting...")
+            yield pickupStation.queue[0]
+
+        # Finished paying, leave the pay station.
+        payStation.release(pay)
+
+
+        # Wait for an open pickup station.
+        pickup = pickupStation.request()
+        yield pickup
+
+        # Enter the pickup station.
+        if stamping:
+            eventStamp(env, "Customer %d is picking up. %d customers in pickup line.", number, len(pickupStation.queue))
+        delay = restaurant.pickupDraws[idx]
+        pickupDelay = env.timeout(delay)
+        restaurant.pickupDuration[idx] = delay
+        yield pickupDelay
+        # Food prep ran in parallel since ordering and has usually finished by
+        # now; only suspend on it if it is actually still outstanding.
+        if not prepDelay.processed:
             yield prepDelay
-            yield pickupDelay
 
-            # Finished picking up items, leave the pickup station.
-            self.restaurant.pickupStation.release(pickup)
-            self.event_stamp(f"Customer {self.number} exits the line.")
-            self.exitTime = env.now
-        else:
-            self.event_stamp(f"Line too long. Customer {self.number} left.")
-            self.restaurant.numCustomersLeft += 1
-        return 1
+        # Finished picking up items, leave the pickup station.
+        pickupStation.release(pickup)
+        if stamping:
+            eventStamp(env, "Customer %d exits the line.", number)
+        restaurant.exitTime[idx] = env.now
+    else:
+        if stamping:
+            eventStamp(env, "Line too long. Customer %d left.", number)
+        restaurant.numCustomersLeft += 1
+    return 1
+
 
-        
-    def event_stamp(self, eventMessage):
-        if self.isEventStampingOn:
-            # print(f"Order line: {len(self.restaurant.orderStation.queue)}\nPay line: {len(self.restaurant.payStation.queue)}\nPickup line: {len(self.restaurant.pickupStation.queue)}\n\n")
-            print(f"{self.env.now} : {eventMessage}")
+# Formatting is deferred, logging-style: callers pass a %-template plus its
+# arguments and nothing is formatted unless stamping is on.
+def eventStamp(env, eventMessage, *args):
+    # Early exit so callers that do not guard still pay no formatting cost here.
+    if not isEventStampingOn:
+        return
+    if args:
+        eventMessage = eventMessage % args
+    print(f"{env.now} : {eventMessage}")
 
 
 
@@ -297,13 +478,34 @@ class Customer:
 
 SIMULATION_ITERATIONS = 10
 
+# If true, use the analytical queue computation instead of the SimPy event loop.
+# Much faster, but downstream buffer blocking is approximated (see AnalyticalRestaurant).
+USE_ANALYTICAL_ENGINE = False
+
 
 # Do we want to print customer events to the console window?
-Customer.isEventStampingOn = False
+isEventStampingOn = False
+
+
+# Run one full simulation and return its stats text. Each iteration is fully
+# independent, so these are farmed out to worker processes below; the restaurant
+# itself holds unpicklable SimPy state, so only the formatted stats come back.
+def runSimulation(iteration):
+    global env, rng
+
+    # Decorrelate the workers: forked processes inherit identical rng state, so
+    # reseed per iteration (offset from RANDOM_SEED when one is set).
+    rng = np.random.default_rng(None if RANDOM_SEED is None else RANDOM_SEED + iteration)
+
+    # Number the restaurant by its iteration regardless of which worker runs it.
+    Restaurant.restaurantNumber = iteration - 1
+    AnalyticalRestaurant.restaurantNumber = iteration - 1
+
+    if USE_ANALYTICAL_ENGINE:
+        restaurant = AnalyticalRestaurant()
+        restaurant.simulate(5000, 120)
+        return restaurant.formatStats()
 
-# Each loop is a simulation.
-for iteration in range(1, SIMULATION_ITERATIONS+1):
-    
     # Create the simulation environment.
     env = simpy.Environment()
 
@@ -318,4 +520,12 @@ for iteration in range(1, SIMULATION_ITERATIONS+1):
     env.process(customers)
 
     env.run(120)
-    restaurant.printStats()
+    return restaurant.formatStats()
+
+
+# The iterations share nothing, so spread them over a pool of processes and
+# print the results in iteration order.
+if __name__ == '__main__':
+    with multiprocessing.Pool() as pool:
+        for stats in pool.map(runSimulation, range(1, SIMULATION_ITERATIONS + 1)):
+            print(stats)